@@ -16,213 +16,287 @@ from __future__ import annotations
 # before importing anything else.
 import iris_grib.tests as tests
 
+import mmap
+import os
 from pathlib import Path
 
 import eccodes
 import iris
+import numpy as np
 import pytest
 
 
 _RESULTDIR_PREFIX = ("integration", "load_convert", "sample_file_loads")
 
+# The eccodes samples directory is fixed for the life of the process, so only
+#  look it up once.
+_SAMPLES_PATH = Path(eccodes.codes_samples_path())
+
+
+def _data_path(*relative_path):
+    return Path(tests.get_data_path(("GRIB",) + relative_path))
+
+
+# Build the test data paths once, at import.  Nothing here touches the files,
+#  so this is still safe when the test data is absent (see tests.skip_data).
+_P_ROTATED = _data_path("rotated_uk", "uk_wrongparam.grib1")
+_P_TIME_BOUND_GRIB1 = _data_path("time_processed", "time_bound.grib1")
+_P_TIME_BOUND_GRIB2 = _data_path("time_processed", "time_bound.grib2")
+_P_3_LAYER = _data_path("3_layer_viz", "3_layer.grib2")
+_P_MISSING_VALUES = _data_path("missing_values", "missing_values.grib2")
+_P_POLAR_STEREO_GRIB1 = _data_path("polar_stereo", "ST4.2013052210.01h")
+_P_POLAR_STEREO_GRIB2 = _data_path(
+    "polar_stereo", "CMC_glb_TMP_ISBL_1015_ps30km_2013052000_P006.grib2"
+)
+_P_LAMBERT_GRIB1 = _data_path("lambert", "lambert.grib1")
+_P_LAMBERT_GRIB2 = _data_path("lambert", "lambert.grib2")
+_P_REGULAR_GG_GRIB1 = _data_path("gaussian", "regular_gg.grib1")
+_P_REGULAR_GG_GRIB2 = _data_path("gaussian", "regular_gg.grib2")
+_P_REDUCED_LL = _data_path("reduced", "reduced_ll.grib1")
+_P_REDUCED_GG_GRIB2 = _data_path("reduced", "reduced_gg.grib2")
+_P_SECOND_ORDER_PACKING = _data_path("grib1_second_order_packing", "GRIB_00008_FRANX01")
+_P_BULLETINS = {
+    byte_len: _data_path("bulletin", f"{byte_len}bytes.grib") for byte_len in (40, 41)
+}
+# Cases of the parametrised tests, as (data path, reference CML name).
+_IJ_DIRECTIONS_CASES = [
+    pytest.param(_data_path("ij_directions", f"{name}.grib2"), f"{name}.cml", id=name)
+    for name in ("ipos_jpos", "ipos_jneg", "ineg_jneg", "ineg_jpos")
+]
+_SHAPE_OF_EARTH_CASES = [
+    # pre-defined sphere
+    pytest.param(
+        _data_path("shape_of_earth", "0.grib2"), "earth_shape_0.cml", id="basic"
+    ),
+    # custom sphere
+    pytest.param(
+        _data_path("shape_of_earth", "1.grib2"), "earth_shape_1.cml", id="custom_1"
+    ),
+    # IAU65 oblate sphere
+    pytest.param(
+        _data_path("shape_of_earth", "2.grib2"), "earth_shape_2.cml", id="IAU65"
+    ),
+    # custom oblate spheroid (km)
+    pytest.param(
+        _data_path("shape_of_earth", "3.grib2"), "earth_shape_3.cml", id="custom_3"
+    ),
+    # IAG-GRS80 oblate spheroid
+    pytest.param(
+        _data_path("shape_of_earth", "4.grib2"), "earth_shape_4.cml", id="IAG_GRS80"
+    ),
+    # WGS84
+    pytest.param(
+        _data_path("shape_of_earth", "5.grib2"), "earth_shape_5.cml", id="WGS84"
+    ),
+    # pre-defined sphere
+    pytest.param(
+        _data_path("shape_of_earth", "6.grib2"), "earth_shape_6.cml", id="pre_6"
+    ),
+    # custom oblate spheroid (m)
+    pytest.param(
+        _data_path("shape_of_earth", "7.grib2"), "earth_shape_7.cml", id="custom_7"
+    ),
+    # grib1 - same as grib2 shape 6, above
+    pytest.param(
+        _data_path("shape_of_earth", "global.grib1"),
+        "earth_shape_grib1.cml",
+        id="grib1",
+    ),
+]
+
+
+# Every data file read by the tests here, for pre-warming.
+_P_ALL = (
+    _P_ROTATED,
+    _P_TIME_BOUND_GRIB1,
+    _P_TIME_BOUND_GRIB2,
+    _P_3_LAYER,
+    _P_MISSING_VALUES,
+    _P_POLAR_STEREO_GRIB1,
+    _P_POLAR_STEREO_GRIB2,
+    _P_LAMBERT_GRIB1,
+    _P_LAMBERT_GRIB2,
+    _P_REGULAR_GG_GRIB1,
+    _P_REGULAR_GG_GRIB2,
+    _P_REDUCED_LL,
+    _P_REDUCED_GG_GRIB2,
+    _P_SECOND_ORDER_PACKING,
+    *_P_BULLETINS.values(),
+    *(case.values[0] for case in _IJ_DIRECTIONS_CASES),
+    *(case.values[0] for case in _SHAPE_OF_EARTH_CASES),
+)
+
+
+def _warm_file(path):
+    # Pull the whole file into the page cache in one pass.
+    with path.open("rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            # Cannot map an empty file, and there is nothing to read anyway.
+            pass
+        elif hasattr(mmap, "MAP_POPULATE"):
+            mm = mmap.mmap(
+                file.fileno(),
+                size,
+                flags=mmap.MAP_SHARED | mmap.MAP_POPULATE,
+                prot=mmap.PROT_READ,
+            )
+            mm.close()
+        elif hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            while file.read(1 << 20):
+                pass
 
-@tests.skip_data
-class TestBasicLoad(tests.IrisGribTest):
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_grib_files():
+    # Pre-read the test data before any loads, rather than faulting each file
+    #  in on demand.  Missing files (i.e. no test data) are left to the
+    #  tests, which will skip.
+    for path in _P_ALL:
+        if path.is_file():
+            _warm_file(path)
+
+
+def _eager_load_cube(path):
+    cube = iris.load_cube(path)
+    # For tests which realise the data anyway, for the CML checksum.  The
+    #  cubes are all small, so do it straight away.
+    _ = cube.data
+    return cube
+
+
+def _assert_cml(cubes, reference_filename):
+    # The tests here are plain pytest classes, which can be distributed
+    #  between pytest-xdist workers, so borrow the CML check from IrisGribTest.
+    tests.IrisGribTest().assertCML(cubes, reference_filename)
+
+
+class TestBasicLoad:
+    @tests.skip_data
     def test_load_rotated(self):
-        cubes = iris.load(
-            tests.get_data_path(("GRIB", "rotated_uk", "uk_wrongparam.grib1"))
-        )
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("rotated.cml",))
+        cube = _eager_load_cube(_P_ROTATED)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("rotated.cml",))
 
+    @tests.skip_data
     def test_load_time_bound(self):
-        cubes = iris.load(
-            tests.get_data_path(("GRIB", "time_processed", "time_bound.grib1"))
-        )
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("time_bound_grib1.cml",))
+        cube = _eager_load_cube(_P_TIME_BOUND_GRIB1)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("time_bound_grib1.cml",))
 
+    @tests.skip_data
     def test_load_time_processed(self):
-        cubes = iris.load(
-            tests.get_data_path(("GRIB", "time_processed", "time_bound.grib2"))
-        )
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("time_bound_grib2.cml",))
+        cube = _eager_load_cube(_P_TIME_BOUND_GRIB2)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("time_bound_grib2.cml",))
 
+    @tests.skip_data
     def test_load_3_layer(self):
-        cubes = iris.load(tests.get_data_path(("GRIB", "3_layer_viz", "3_layer.grib2")))
-        cubes = iris.cube.CubeList([cubes[1], cubes[0], cubes[2]])
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("3_layer.cml",))
+        cubes = iris.load(_P_3_LAYER)
+        # Match the reference order, by swapping in place.
+        cubes[0], cubes[1] = cubes[1], cubes[0]
+        _assert_cml(cubes, _RESULTDIR_PREFIX + ("3_layer.cml",))
 
+    @tests.skip_data
     def test_load_masked(self):
-        gribfile = tests.get_data_path(
-            ("GRIB", "missing_values", "missing_values.grib2")
-        )
-        cubes = iris.load(gribfile)
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("missing_values_grib2.cml",))
+        cube = _eager_load_cube(_P_MISSING_VALUES)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("missing_values_grib2.cml",))
 
+    @tests.skip_data
     def test_polar_stereo_grib1(self):
-        cube = iris.load_cube(
-            tests.get_data_path(("GRIB", "polar_stereo", "ST4.2013052210.01h"))
-        )
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("polar_stereo_grib1.cml",))
+        cube = _eager_load_cube(_P_POLAR_STEREO_GRIB1)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("polar_stereo_grib1.cml",))
 
+    @tests.skip_data
     def test_polar_stereo_grib2_grid_definition(self):
-        cube = iris.load_cube(
-            tests.get_data_path(
-                (
-                    "GRIB",
-                    "polar_stereo",
-                    "CMC_glb_TMP_ISBL_1015_ps30km_2013052000_P006.grib2",
-                )
-            )
-        )
-        self.assertEqual(cube.shape, (200, 247))
+        # Only the grid is checked here, so leave the data unread.
+        cube = iris.load_cube(_P_POLAR_STEREO_GRIB2)
+        assert cube.shape == (200, 247)
         pxc = cube.coord("projection_x_coordinate")
-        self.assertAlmostEqual(pxc.points.max(), 4769905.5125, places=4)
-        self.assertAlmostEqual(pxc.points.min(), -2610094.4875, places=4)
         pyc = cube.coord("projection_y_coordinate")
-        self.assertAlmostEqual(pyc.points.max(), -216.1459, places=4)
-        self.assertAlmostEqual(pyc.points.min(), -5970216.1459, places=4)
-        self.assertEqual(pyc.coord_system, pxc.coord_system)
-        self.assertEqual(
-            pyc.coord_system.grid_mapping_name,
-            "polar_stereographic",
+        px, py = pxc.points, pyc.points
+        np.testing.assert_allclose(
+            [px.max(), px.min(), py.max(), py.min()],
+            [4769905.5125, -2610094.4875, -216.1459, -5970216.1459],
+            rtol=0,
+            atol=5e-5,
         )
-        self.assertEqual(pyc.coord_system.central_lat, 90.0)
-        self.assertEqual(pyc.coord_system.central_lon, 249.0)
-        self.assertEqual(pyc.coord_system.false_easting, 0.0)
-        self.assertEqual(pyc.coord_system.false_northing, 0.0)
-        self.assertEqual(pyc.coord_system.true_scale_lat, 60.0)
-
+        cs = pyc.coord_system
+        assert cs == pxc.coord_system
+        assert cs.grid_mapping_name == "polar_stereographic"
+        assert (
+            cs.central_lat,
+            cs.central_lon,
+            cs.false_easting,
+            cs.false_northing,
+            cs.true_scale_lat,
+        ) == (90.0, 249.0, 0.0, 0.0, 60.0)
+
+    @tests.skip_data
     def test_lambert_grib1(self):
-        cube = iris.load_cube(tests.get_data_path(("GRIB", "lambert", "lambert.grib1")))
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("lambert_grib1.cml",))
+        cube = _eager_load_cube(_P_LAMBERT_GRIB1)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("lambert_grib1.cml",))
 
+    @tests.skip_data
     def test_lambert_grib2(self):
-        cube = iris.load_cube(tests.get_data_path(("GRIB", "lambert", "lambert.grib2")))
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("lambert_grib2.cml",))
+        cube = _eager_load_cube(_P_LAMBERT_GRIB2)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("lambert_grib2.cml",))
 
+    @tests.skip_data
     def test_regular_gg_grib1(self):
-        cube = iris.load_cube(
-            tests.get_data_path(("GRIB", "gaussian", "regular_gg.grib1"))
-        )
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("regular_gg_grib1.cml",))
+        cube = _eager_load_cube(_P_REGULAR_GG_GRIB1)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("regular_gg_grib1.cml",))
 
+    @tests.skip_data
     def test_regular_gg_grib2(self):
-        cube = iris.load_cube(
-            tests.get_data_path(("GRIB", "gaussian", "regular_gg.grib2"))
-        )
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("regular_gg_grib2.cml",))
+        cube = _eager_load_cube(_P_REGULAR_GG_GRIB2)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("regular_gg_grib2.cml",))
 
+    @tests.skip_data
     def test_reduced_ll(self):
-        cube = iris.load_cube(
-            tests.get_data_path(("GRIB", "reduced", "reduced_ll.grib1"))
-        )
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("reduced_ll_grib1.cml",))
+        cube = _eager_load_cube(_P_REDUCED_LL)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("reduced_ll_grib1.cml",))
 
+    @tests.skip_data
     def test_reduced_gg_grib1(self):
-        cube = iris.load_cube(
-            Path(eccodes.codes_samples_path()) / "reduced_gg_ml_grib1.tmpl"
-        )
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("reduced_gg_grib1.cml",))
+        cube = _eager_load_cube(_SAMPLES_PATH / "reduced_gg_ml_grib1.tmpl")
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("reduced_gg_grib1.cml",))
 
+    @tests.skip_data
     def test_reduced_gg_grib2(self):
-        cube = iris.load_cube(
-            tests.get_data_path(("GRIB", "reduced", "reduced_gg.grib2"))
-        )
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("reduced_gg_grib2.cml",))
+        cube = _eager_load_cube(_P_REDUCED_GG_GRIB2)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("reduced_gg_grib2.cml",))
 
+    @tests.skip_data
     def test_second_order_packing(self):
-        cube = iris.load_cube(
-            tests.get_data_path(
-                ("GRIB", "grib1_second_order_packing", "GRIB_00008_FRANX01")
-            )
-        )
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("second_order_packing.cml",))
+        cube = _eager_load_cube(_P_SECOND_ORDER_PACKING)
+        _assert_cml(cube, _RESULTDIR_PREFIX + ("second_order_packing.cml",))
 
+    @tests.skip_data
     def test_bulletin_headers(self):
-        for byte_len in (40, 41):
-            cube = iris.load_cube(
-                tests.get_data_path(("GRIB", "bulletin", f"{byte_len}bytes.grib"))
-            )
-            self.assertCML(cube, _RESULTDIR_PREFIX + (f"bulletin_{byte_len}bytes.cml",))
+        for byte_len, path in _P_BULLETINS.items():
+            cube = _eager_load_cube(path)
+            _assert_cml(cube, _RESULTDIR_PREFIX + (f"bulletin_{byte_len}bytes.cml",))
 
 
 @tests.skip_data
-class TestIjDirections(tests.IrisGribTest):
-    @staticmethod
-    def _old_compat_load(name):
-        filepath = tests.get_data_path(("GRIB", "ij_directions", name))
-        cube = iris.load_cube(filepath)
-        return cube
+@pytest.mark.parametrize(("path", "cml"), _IJ_DIRECTIONS_CASES)
+def test_ij_directions(path, cml):
+    cube = _eager_load_cube(path)
+    _assert_cml(cube, _RESULTDIR_PREFIX + (cml,))
 
-    def test_ij_directions_ipos_jpos(self):
-        cubes = self._old_compat_load("ipos_jpos.grib2")
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("ipos_jpos.cml",))
 
-    def test_ij_directions_ipos_jneg(self):
-        cubes = self._old_compat_load("ipos_jneg.grib2")
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("ipos_jneg.cml",))
-
-    def test_ij_directions_ineg_jneg(self):
-        cubes = self._old_compat_load("ineg_jneg.grib2")
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("ineg_jneg.cml",))
-
-    def test_ij_directions_ineg_jpos(self):
-        cubes = self._old_compat_load("ineg_jpos.grib2")
-        self.assertCML(cubes, _RESULTDIR_PREFIX + ("ineg_jpos.cml",))
+@tests.skip_data
+@pytest.mark.parametrize(("path", "cml"), _SHAPE_OF_EARTH_CASES)
+def test_shape_of_earth(path, cml):
+    cube = _eager_load_cube(path)
+    _assert_cml(cube, _RESULTDIR_PREFIX + (cml,))
 
 
-@tests.skip_data
-class TestShapeOfEarth(tests.IrisGribTest):
-    @staticmethod
-    def _old_compat_load(name):
-        filepath = tests.get_data_path(("GRIB", "shape_of_earth", name))
-        cube = iris.load_cube(filepath)
-        return cube
-
-    def test_shape_of_earth_basic(self):
-        # pre-defined sphere
-        cube = self._old_compat_load("0.grib2")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_0.cml",))
-
-    def test_shape_of_earth_custom_1(self):
-        # custom sphere
-        cube = self._old_compat_load("1.grib2")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_1.cml",))
-
-    def test_shape_of_earth_IAU65(self):
-        # IAU65 oblate sphere
-        cube = self._old_compat_load("2.grib2")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_2.cml",))
-
-    def test_shape_of_earth_custom_3(self):
-        # custom oblate spheroid (km)
-        cube = self._old_compat_load("3.grib2")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_3.cml",))
-
-    def test_shape_of_earth_IAG_GRS80(self):
-        # IAG-GRS80 oblate spheroid
-        cube = self._old_compat_load("4.grib2")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_4.cml",))
-
-    def test_shape_of_earth_WGS84(self):
-        # WGS84
-        cube = self._old_compat_load("5.grib2")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_5.cml",))
-
-    def test_shape_of_earth_pre_6(self):
-        # pre-defined sphere
-        cube = self._old_compat_load("6.grib2")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_6.cml",))
-
-    def test_shape_of_earth_custom_7(self):
-        # custom oblate spheroid (m)
-        cube = self._old_compat_load("7.grib2")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_7.cml",))
-
-    def test_shape_of_earth_grib1(self):
-        # grib1 - same as grib2 shape 6, above
-        cube = self._old_compat_load("global.grib1")
-        self.assertCML(cube, _RESULTDIR_PREFIX + ("earth_shape_grib1.cml",))
+@pytest.fixture(scope="module")
+def _grib1_tmpdir(tmp_path_factory):
+    # One directory for all the GRIB1 files generated by this module.  Each
+    #  file name is specific to its fixture parameter, so they cannot collide.
+    return tmp_path_factory.mktemp("grib1_generated")
 
 
 class TestTimesGrib1:
@@ -232,37 +306,120 @@ class TestTimesGrib1:
     #  loading code while ensuring continued support for all possible
     #  scenarios.
 
-    @pytest.fixture(params=[1, 2, 3, 4, 5, 10, 113, 118, 123, 124], autouse=True)
+    @pytest.fixture(params=[1, 2, 3, 4, 5, 10, 113, 118, 123, 124], scope="module")
     # Note that the following values are not supported by Eccodes - it can
     #  not provide a startStep value unless the timeRangeIndicator is present
     #  in eccodes/definitions/grib1/localConcepts/edzw/stepType.def:
     #  [51, 114, 115, 116, 117, 125].
-    def _get_time_range_file(self, request, tmp_path):
-        save_file = tmp_path / "TestTimes.grib1"
+    def time_range_file(self, request, _grib1_tmpdir):
+        # Module-scoped, so each file is only generated once per parameter.
         time_range_indicator = request.param
-
-        # Make a file with 10 ascending time steps.
-        with save_file.open("wb") as open_file:
-            for time_step in range(10):
-                grib_message = eccodes.codes_grib_new_from_samples("GRIB1")
-                eccodes.codes_set_long(grib_message, "P1", time_step)
-                eccodes.codes_set_long(grib_message, "P2", time_step + 1)
-                eccodes.codes_set_long(
-                    grib_message, "timeRangeIndicator", time_range_indicator
-                )
-                eccodes.codes_write(grib_message, open_file)
-                eccodes.codes_release(grib_message)
-
-        self.time_range_indicator = time_range_indicator
-        self.save_file = save_file
-
-    def test_time_range(self):
-        cube = iris.load_cube(self.save_file)
-        tests.IrisGribTest().assertCML(
-            cube, _RESULTDIR_PREFIX + (f"time_range_{self.time_range_indicator}.cml",)
+        save_file = _grib1_tmpdir / f"TestTimes_{time_range_indicator}.grib1"
+
+        # Parse the sample once, and clone it for each message.
+        base_message = eccodes.codes_grib_new_from_samples("GRIB1")
+        eccodes.codes_set_long(base_message, "timeRangeIndicator", time_range_indicator)
+
+        # Make a file with 10 ascending time steps, written in one go.
+        buffer = bytearray()
+        for time_step in range(10):
+            grib_message = eccodes.codes_clone(base_message)
+            eccodes.codes_set_long(grib_message, "P1", time_step)
+            eccodes.codes_set_long(grib_message, "P2", time_step + 1)
+            buffer += eccodes.codes_get_message(grib_message)
+            eccodes.codes_release(grib_message)
+        eccodes.codes_release(base_message)
+        save_file.write_bytes(buffer)
+
+        return time_range_indicator, save_file
+
+    def test_time_range(self, time_range_file):
+        time_range_indicator, save_file = time_range_file
+        cube = iris.load_cube(save_file)
+        _assert_cml(
+            cube, _RESULTDIR_PREFIX + (f"time_range_{time_range_indicator}.cml",)
         )
 
 
+def _advise_sequential(file):
+    # Hint that a fixture source file will be read start to end.  Mmap faults
+    #  use the readahead of the descriptor that is mapped.
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+# Single-octet keys of a GRIB1 polar stereographic grid description section
+#  (GDS), by (1-based) octet number.
+_GRIB1_POLAR_STEREO_GDS_OCTETS = {"projectionCentreFlag": 27}
+
+
+def _patched_grib1_message(path, codes):
+    # Return the first message in a file with the given GDS octets set, or
+    #  None if that cannot be done by patching, i.e. it needs eccodes.
+    if not all(key in _GRIB1_POLAR_STEREO_GDS_OCTETS for key, value in codes):
+        return None
+    with path.open("rb") as file:
+        _advise_sequential(file)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = mm.find(b"GRIB")
+            # Indicator section: "GRIB", 3-octet total length, edition number.
+            if start < 0 or mm[start + 7] != 1:
+                return None
+            total_length = int.from_bytes(mm[start + 4 : start + 7], "big")
+            message = bytearray(mm[start : start + total_length])
+    if len(message) != total_length or not message.endswith(b"7777"):
+        return None
+    # The product definition section follows the indicator section, and gives
+    #  its own length (first 3 octets) and whether a GDS follows (octet 8).
+    pds_start = 8
+    pds_length = int.from_bytes(message[pds_start : pds_start + 3], "big")
+    if not message[pds_start + 7] & 0x80:
+        return None
+    gds_start = pds_start + pds_length
+    # GDS octet 6 is the data representation type: 5 is polar stereographic.
+    if message[gds_start + 5] != 5:
+        return None
+    for key, value in codes:
+        message[gds_start + _GRIB1_POLAR_STEREO_GDS_OCTETS[key] - 1] = value
+    return bytes(message)
+
+
+def _polar_stereo_grib1_file(path, n_messages):
+    message = eccodes.codes_grib_new_from_samples("GRIB1")
+    eccodes.codes_set(message, "dataRepresentationType", 5)
+    path.write_bytes(eccodes.codes_get_message(message) * n_messages)
+    eccodes.codes_release(message)
+
+
+def test_patched_grib1_message(tmp_path):
+    # Check that patching gives the same (first) message as eccodes does.
+    path = tmp_path / "polar_stereo.grib1"
+    _polar_stereo_grib1_file(path, n_messages=2)
+    result = _patched_grib1_message(path, [("projectionCentreFlag", 1)])
+
+    with path.open("rb") as file:
+        gid = eccodes.codes_grib_new_from_file(file)
+    eccodes.codes_set(gid, "projectionCentreFlag", 1)
+    expected = eccodes.codes_get_message(gid)
+    eccodes.codes_release(gid)
+
+    assert result == expected
+
+
+def test_patched_grib1_message_unsupported(tmp_path):
+    # Anything but a GRIB1 polar stereographic grid is left to eccodes.
+    path = tmp_path / "regular_ll.grib1"
+    message = eccodes.codes_grib_new_from_samples("GRIB1")
+    path.write_bytes(eccodes.codes_get_message(message))
+    eccodes.codes_release(message)
+    assert _patched_grib1_message(path, [("projectionCentreFlag", 1)]) is None
+
+    # So are keys which have no known octet.
+    path = tmp_path / "polar_stereo.grib1"
+    _polar_stereo_grib1_file(path, n_messages=1)
+    assert _patched_grib1_message(path, [("indicatorOfParameter", 34)]) is None
+
+
 class TestFullCoverageGrib1:
     # We do not have a full set of GRIB1 files that exercise our entire GRIB1
     #  loading code. This class generates files to cover those gaps. We use CML
@@ -274,17 +431,17 @@ class TestFullCoverageGrib1:
     id_path_codes = [
         (
             "polar_stereo_south",
-            tests.get_data_path(("GRIB", "polar_stereo", "ST4.2013052210.01h")),
+            _P_POLAR_STEREO_GRIB1,
             [("projectionCentreFlag", 1)],
         ),
         (
             "y_wind",
-            tests.get_data_path(("GRIB", "gaussian", "regular_gg.grib1")),
+            _P_REGULAR_GG_GRIB1,
             [("indicatorOfParameter", 34)],
         ),
         (
             "mapped_cf_data",
-            Path(eccodes.codes_samples_path()) / "GRIB1.tmpl",
+            _SAMPLES_PATH / "GRIB1.tmpl",
             [("table2Version", 128), ("centre", 98), ("indicatorOfParameter", 34)],
         ),
     ]
@@ -294,15 +451,29 @@ class TestFullCoverageGrib1:
         ids=[id for id, path, codes in id_path_codes],
         autouse=True,
     )
-    def _get_grib1_file(self, request, tmp_path):
+    def _get_grib1_file(self, request, _grib1_tmpdir):
         id_, path, codes = request.param
         path_original = Path(path)
-        path_modified = tmp_path / "tmp_file.grib1"
-        with path_original.open("rb") as file_original:
-            gid = eccodes.codes_grib_new_from_file(file_original)
+        path_modified = _grib1_tmpdir / f"TestFullCoverage_{id_}.grib1"
+        # Where only whole octets need setting, patch the message bytes rather
+        #  than going through an eccodes decode + encode.
+        message = _patched_grib1_message(path_original, codes)
+        if message is not None:
+            path_modified.write_bytes(message)
+        else:
+            # Hand eccodes a view of the memory-mapped file, rather than
+            #  reading it through a Python file buffer first.
+            with path_original.open("rb") as file_original:
+                _advise_sequential(file_original)
+                with (
+                    mmap.mmap(file_original.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                    memoryview(mm) as view,
+                ):
+                    gid = eccodes.codes_new_from_message(view)
             for key, value in codes:
                 eccodes.codes_set(gid, key, value)
-            with path_modified.open("wb") as file_modified:
+            # A single message, so no need for write buffering.
+            with path_modified.open("wb", buffering=0) as file_modified:
                 eccodes.codes_write(gid, file_modified)
             eccodes.codes_release(gid)
         self.id_ = id_
@@ -310,9 +481,7 @@ class TestFullCoverageGrib1:
 
     def test_grib1(self):
         cube = iris.load_cube(self.file_path)
-        tests.IrisGribTest().assertCML(
-            cube, _RESULTDIR_PREFIX + (f"{self.id_}_grib1.cml",)
-        )
+        _assert_cml(cube, _RESULTDIR_PREFIX + (f"{self.id_}_grib1.cml",))
 
 
 if __name__ == "__main__":